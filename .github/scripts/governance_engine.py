@@ -1,3 +1,4 @@
+import json
 import os
 import yaml
 import requests
@@ -32,6 +33,9 @@ ROLE_HIERARCHY = [
     "Maintainer"
 ]
 
+# Precomputed hierarchy index table to avoid repeated list scans during validation
+ROLE_INDEX = {role: idx for idx, role in enumerate(ROLE_HIERARCHY)}
+
 # Exclusive roles possessing supreme repository privileges
 PROTECTED_ROLES = ["OWNER"]
 
@@ -43,12 +47,13 @@ headers = {
 
 def get_authorized_users():
     """
-    Parses the .github/CODEOWNERS file to identify personnel authorized 
+    Parses the .github/CODEOWNERS file to identify personnel authorized
     to approve governance modifications and role assignments.
+    Returns a set of lowercase usernames for constant-time membership checks.
     """
     if not os.path.exists(CODEOWNERS_PATH):
         print(f"[WARNING] Code owners configuration not found at {CODEOWNERS_PATH}.")
-        return []
+        return set()
     
     authorized = set()
     try:
@@ -62,8 +67,8 @@ def get_authorized_users():
                             authorized.add(part.lstrip('@').lower())
     except Exception as e:
         print(f"[ERROR] Failed to parse CODEOWNERS file: {e}")
-    
-    return list(authorized)
+
+    return authorized
 
 def validate_role_change(action, current_role, target_role):
     """
@@ -71,19 +76,15 @@ def validate_role_change(action, current_role, target_role):
     to determine the validity of a promotion or demotion.
     Returns a tuple: (is_valid: bool, error_message: str|None)
     """
-    if target_role not in ROLE_HIERARCHY:
+    if target_role not in ROLE_INDEX:
         return False, f"Role '{target_role}' is not recognized within the official governance hierarchy."
-    
+
     if current_role in PROTECTED_ROLES:
         return False, f"Role '{current_role}' represents a supreme repository privilege and cannot be modified via automated commands."
-    
-    # Handle legacy or non-standard roles outside the standard progression hierarchy
-    if current_role not in ROLE_HIERARCHY:
-        current_idx = -1 
-    else:
-        current_idx = ROLE_HIERARCHY.index(current_role)
-    
-    target_idx = ROLE_HIERARCHY.index(target_role)
+
+    # Legacy or non-standard roles outside the standard progression hierarchy resolve to -1
+    current_idx = ROLE_INDEX.get(current_role, -1)
+    target_idx = ROLE_INDEX[target_role]
 
     if action == "promote":
         if target_idx <= current_idx:
@@ -207,28 +208,39 @@ def update_user_history(username, event_type, details, is_bot=False):
     with open(path, 'w') as f:
         yaml.dump(data, f, sort_keys=False, default_flow_style=False)
 
-def update_ledger(event_type, username, details, is_bot=False):
-    """Maintains a unified, global ledger encompassing all governance operations."""
+def build_ledger_event(event_type, username, details):
+    """Constructs the standard ledger event structure stamped at creation time."""
+    return {
+        "timestamp": get_now_ist_str(),
+        "type": event_type,
+        "username": username,
+        "details": details
+    }
+
+def append_ledger_events(events, is_bot=False):
+    """Appends a batch of pre-built events to the global ledger within a single read/write cycle."""
+    if not events:
+        return
+
     ledger_file = BOT_LEDGER_PATH if is_bot else LEDGER_PATH
     os.makedirs(os.path.dirname(ledger_file), exist_ok=True)
-    
+
     data = {"events": []}
     if os.path.exists(ledger_file) and os.path.getsize(ledger_file) > 0:
         with open(ledger_file, 'r') as f:
             existing_data = yaml.safe_load(f)
             if existing_data and 'events' in existing_data:
                 data = existing_data
-    
-    data['events'].append({
-        "timestamp": get_now_ist_str(),
-        "type": event_type,
-        "username": username,
-        "details": details
-    })
-    
+
+    data['events'].extend(events)
+
     with open(ledger_file, 'w') as f:
         yaml.dump(data, f, sort_keys=False, default_flow_style=False)
 
+def update_ledger(event_type, username, details, is_bot=False):
+    """Maintains a unified, global ledger encompassing all governance operations."""
+    append_ledger_events([build_ledger_event(event_type, username, details)], is_bot=is_bot)
+
 def post_comment(issue_number, body):
     """Transmits a formal status or error message directly to the Pull Request or Issue thread."""
     url = f"https://api.github.com/repos/{REPO}/issues/{issue_number}/comments"
@@ -445,8 +457,6 @@ def handle_bot_command(action, target_user, author, pr_number, branch_name):
 
 def run_command_mode(event_path, event_name):
     """Primary execution pathway for interactive governance commands originating from issue/PR comments."""
-    import json
-    
     if not os.path.exists(event_path):
         print("[ERROR] GitHub event payload path not found.")
         return
@@ -558,7 +568,6 @@ def main():
         run_command_mode(event_path, event_name)
         
     elif event_name == 'pull_request':
-        import json
         with open(event_path, 'r') as f:
             event = json.load(f)
         if event.get('pull_request', {}).get('merged'):
@@ -594,6 +603,11 @@ def run_sync_mode():
     
     last_sync = registry['metadata'].get('last_sync')
     
+    # Accumulate ledger events in memory and flush them in one write per ledger,
+    # avoiding a full YAML re-serialization for every individual event
+    pending_ledger_events = []
+    pending_bot_ledger_events = []
+
     # Determine Sync Paradigm
     clean_start = False
     if not last_sync:
@@ -632,12 +646,11 @@ def run_sync_mode():
                 f"Assigned role: {contributor['role']} authorized by {contributor.get('assigned_by', 'system_migration')}",
                 is_bot=False
             )
-            update_ledger(
+            pending_ledger_events.append(build_ledger_event(
                 "ROLE_ASSIGNMENT",
                 username,
-                f"Role: {contributor['role']}, Authorized by: {contributor.get('assigned_by', 'system_migration')}",
-                is_bot=False
-            )
+                f"Role: {contributor['role']}, Authorized by: {contributor.get('assigned_by', 'system_migration')}"
+            ))
         
         # Re-initialize bot ledgers
         for bot in bots:
@@ -668,7 +681,7 @@ def run_sync_mode():
         if is_bot:
             # Divert bot activity exclusively to bot ledgers
             update_user_history(username, "PR_MERGED", f"Merged PR #{pr['number']}: {pr['title']} ({pr['url']})", is_bot=True)
-            update_ledger("PR_MERGED", username, f"PR #{pr['number']}: {pr['title']}", is_bot=True)
+            pending_bot_ledger_events.append(build_ledger_event("PR_MERGED", username, f"PR #{pr['number']}: {pr['title']}"))
             # Ensure bot accounts are excluded from human governance registries
             continue
         
@@ -691,14 +704,20 @@ def run_sync_mode():
             existing_usernames.add(username.lower())
             
             update_user_history(username, "ONBOARDING", f"Achieved Newbie rank via verified code merge: {pr_url}", is_bot=False)
-            update_ledger("ONBOARDING", username, f"Initial code merge recorded: {pr_url}", is_bot=False)
+            pending_ledger_events.append(build_ledger_event("ONBOARDING", username, f"Initial code merge recorded: {pr_url}"))
         
         # 2. General Ledger Update
         update_user_history(username, "PR_MERGED", f"Merged PR #{pr['number']}: {pr['title']} ({pr['url']})", is_bot=False)
-        update_ledger("PR_MERGED", username, f"PR #{pr['number']}: {pr['title']}", is_bot=False)
+        pending_ledger_events.append(build_ledger_event("PR_MERGED", username, f"PR #{pr['number']}: {pr['title']}"))
+
+    # Flush accumulated ledger batches to disk in a single pass per ledger
+    append_ledger_events(pending_ledger_events, is_bot=False)
+    append_ledger_events(pending_bot_ledger_events, is_bot=True)
 
     # 3. Global Activity Evaluation Protocol
     print("\n[INFO] Commencing global activity audit...")
+    # Evaluate the entire audit batch against a single reference timestamp
+    now_naive = datetime.now()
     for entry in contributors:
         username = entry['username']
         # Fail-safe logic to skip miscategorized automation accounts
@@ -716,7 +735,6 @@ def run_sync_mode():
             
             # 90-Day Policy Enforcement Check
             last_act_dt = datetime.strptime(last_act, "%Y-%m-%d")
-            now_naive = datetime.now()
             diff = now_naive - last_act_dt
             
             if diff > timedelta(days=90):